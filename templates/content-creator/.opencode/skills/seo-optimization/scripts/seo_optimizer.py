@@ -4,188 +4,510 @@ SEO Content Optimizer - Analyzes and optimizes content for SEO
 Supports both English and Chinese content with language-specific analysis
 """
 
+import bisect
+import functools
+import math
 import re
-from typing import Dict, List, Set, Optional
+from collections import Counter
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Set,
+    Optional,
+    Sequence,
+    Tuple,
+)
 import json
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize obj to compact JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # orjson only emits valid UTF-8, so a str holding a lone
+            # surrogate (e.g. one decoded by json.loads) needs the stdlib
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Precompiled patterns
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_WS_RE = re.compile(r"\s")
+_SENT_ZH_RE = re.compile(r"[。！？；\n]+")
+_SENT_EN_RE = re.compile(r"[.!?]+")
+_WORD_EN_RE = re.compile(r"\b[a-z]+\b")
+_LINK_RE = re.compile(r"\[[^\]]*\]\((/[^)]*|https?://[^)]*)\)")
+_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+# A single CJK character, or a run of other alphanumerics ([^\W_] == isalnum)
+_ZH_TOKEN_RE = re.compile(r"[\u4e00-\u9fff]|[^\W_\u4e00-\u9fff]+")
+
+
+def _count_cjk(text: str) -> int:
+    """Count CJK characters without materializing a list of matches"""
+    return _CJK_RE.subn("", text)[1]
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words"""
+    return len(text.split())
+
+
+# numba and numpy are only imported when the kernel is first needed, so runs
+# that never count non-ASCII text don't pay for loading them
+np = None
+_IS_SPACE = None
+_cjk_nonspace_kernel = None
+
+
+def _load_kernel() -> None:
+    """Import numba and numpy and build the CJK/non-space counting kernel"""
+    global np, _IS_SPACE, _cjk_nonspace_kernel
+    import numba
+    import numpy
+
+    @numba.njit(cache=True)
+    def kernel(codepoints, is_space):
+        cjk = 0
+        nonspace = 0
+        for i in range(codepoints.shape[0]):
+            c = codepoints[i]
+            if c <= 0x3000 and is_space[c]:
+                continue
+            nonspace += 1
+            if 0x4E00 <= c <= 0x9FFF:
+                cjk += 1
+        return cjk, nonspace
+
+    np = numpy
+    # is_space[c] == chr(c).isspace(); no whitespace code point is above U+3000
+    _IS_SPACE = np.array([chr(c).isspace() for c in range(0x3001)], dtype=np.bool_)
+    _cjk_nonspace_kernel = kernel
+
+
+def _count_cjk_and_nonspace_regex(text: str) -> Tuple[int, int]:
+    return _count_cjk(text), len(_WS_RE.sub("", text))
+
+
+def _count_cjk_and_nonspace_kernel(text: str) -> Tuple[int, int]:
+    # surrogatepass keeps one uint32 per code point, lone surrogates included
+    codepoints = np.frombuffer(
+        text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    cjk, nonspace = _cjk_nonspace_kernel(codepoints, _IS_SPACE)
+    return int(cjk), int(nonspace)
+
+
+# Covers CJK, ASCII and Unicode whitespace, and a lone surrogate
+_KERNEL_CHECK_TEXT = "中文 text\t\n\x1c\xa0\u3000\ud83d 测试\U0001f600"
+# None until the numba kernel has been checked against the regex path
+_USE_KERNEL = None
+
+
+def _count_cjk_and_nonspace(text: str) -> Tuple[int, int]:
+    """Count CJK characters and non-whitespace characters.
+
+    With numba installed both counts come from one JIT-compiled pass over
+    the UTF-32 code points; otherwise two regex scans are used. On first use
+    the kernel is loaded and checked against the regex path, which stays in
+    use if numba is missing, the kernel fails, or the two disagree.
+    """
+    global _USE_KERNEL
+    if _USE_KERNEL is None:
+        try:
+            _load_kernel()
+            _USE_KERNEL = _count_cjk_and_nonspace_kernel(
+                _KERNEL_CHECK_TEXT
+            ) == _count_cjk_and_nonspace_regex(_KERNEL_CHECK_TEXT)
+        except Exception:
+            _USE_KERNEL = False
+    if _USE_KERNEL:
+        return _count_cjk_and_nonspace_kernel(text)
+    return _count_cjk_and_nonspace_regex(text)
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield lines one at a time instead of building a list with split()"""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _count_keywords(text: str, keywords: List[str]) -> Dict[str, int]:
+    """Count non-overlapping occurrences of each keyword in text.
+
+    With pyahocorasick installed and enough keywords, every keyword is
+    counted in a single pass over the text instead of one str.count() each.
+    """
+    unique = set(keywords)
+    if ahocorasick is None or len(unique) < 4 or "" in unique:
+        return {kw: text.count(kw) for kw in unique}
+
+    automaton = ahocorasick.Automaton()
+    for kw in unique:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+
+    counts = dict.fromkeys(unique, 0)
+    next_start = dict.fromkeys(unique, 0)
+    for end, kw in automaton.iter(text):
+        start = end - len(kw) + 1
+        # Skip hits overlapping the previous one so counts match str.count()
+        if start >= next_start[kw]:
+            counts[kw] += 1
+            next_start[kw] = end + 1
+    return counts
+
 
 # Language detection
 def detect_language(text: str) -> str:
     """Detect if text is primarily Chinese or English"""
-    chinese_chars = len(re.findall(r"[\u4e00-\u9fff]", text))
-    total_chars = len(re.sub(r"\s", "", text))
+    # Fast path: pure ASCII text cannot contain CJK characters
+    if text.isascii():
+        return "en"
 
-    if total_chars == 0:
+    chinese_chars, total_chars = _count_cjk_and_nonspace(text)
+    if chinese_chars == 0:
         return "en"
 
     chinese_ratio = chinese_chars / total_chars
     return "zh" if chinese_ratio > 0.3 else "en"
 
 
-# Chinese word segmentation
-def segment_chinese(text: str) -> List[str]:
-    """Segment Chinese text into words"""
+# Chinese word segmentation, preferring the C-accelerated jieba_fast fork
+try:
+    import jieba_fast as jieba
+except ImportError:
     try:
         import jieba
-
-        return list(jieba.cut(text))
     except ImportError:
-        # Fallback: simple character-based segmentation
-        words = []
-        current_word = ""
-        for char in text:
-            if "\u4e00" <= char <= "\u9fff":
-                if current_word:
-                    words.append(current_word)
-                    current_word = ""
-                words.append(char)
-            elif char.isalnum():
-                current_word += char
-            else:
-                if current_word:
-                    words.append(current_word)
-                    current_word = ""
-        if current_word:
-            words.append(current_word)
-        return words
+        jieba = None
+
+# One tokenizer for the process; its dictionary is loaded on first use, so
+# runs that never segment Chinese text don't pay for it
+_JIEBA_TOKENIZER = jieba.Tokenizer() if jieba is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def segment_chinese(text: str) -> Tuple[str, ...]:
+    """Segment Chinese text into words (memoized, so the result is a tuple)"""
+    if _JIEBA_TOKENIZER is not None:
+        _JIEBA_TOKENIZER.check_initialized()
+        return tuple(_JIEBA_TOKENIZER.cut(text))
+
+    # Fallback: simple character-based segmentation
+    return tuple(_ZH_TOKEN_RE.findall(text))
+
+
+# English stop words
+STOP_WORDS_EN = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "as",
+        "is",
+        "was",
+        "are",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "can",
+        "shall",
+    }
+)
+
+# Chinese stop words
+STOP_WORDS_ZH = frozenset(
+    {
+        "的",
+        "是",
+        "在",
+        "了",
+        "和",
+        "与",
+        "或",
+        "有",
+        "这",
+        "那",
+        "我",
+        "你",
+        "他",
+        "她",
+        "它",
+        "们",
+        "就",
+        "也",
+        "都",
+        "而",
+        "及",
+        "着",
+        "把",
+        "被",
+        "让",
+        "给",
+        "从",
+        "到",
+        "为",
+        "以",
+        "对",
+        "于",
+        "但",
+        "如",
+        "若",
+        "因",
+        "所",
+        "能",
+        "会",
+        "可以",
+        "已经",
+        "可能",
+        "应该",
+        "需要",
+        "这个",
+        "那个",
+        "什么",
+        "怎么",
+        "如何",
+        "为什么",
+        "因为",
+        "所以",
+        "但是",
+        "然而",
+        "不过",
+        "如果",
+        "虽然",
+        "即使",
+        "无论",
+        "一个",
+        "一种",
+        "一些",
+        "这些",
+        "那些",
+        "自己",
+        "我们",
+        "你们",
+        "他们",
+        "它们",
+    }
+)
+
+# SEO best practices for English (Google)
+BEST_PRACTICES_EN = {
+    "title_length": (50, 60),
+    "meta_description_length": (150, 160),
+    "url_length": (50, 60),
+    "paragraph_length": (40, 150),
+    "heading_keyword_placement": True,
+    "keyword_density": (0.01, 0.03),  # 1-3%
+}
+
+# SEO best practices for Chinese (Baidu)
+BEST_PRACTICES_ZH = {
+    "title_length": (20, 30),  # 20-30 Chinese characters
+    "meta_description_length": (80, 120),  # 80-120 Chinese characters
+    "url_length": (30, 50),
+    "paragraph_length": (100, 300),  # Chinese characters
+    "heading_keyword_placement": True,
+    "keyword_density": (0.02, 0.08),  # 2-8% for Chinese
+}
+
+
+# Score bands are (lower bounds, points): bisect_right over the bounds picks
+# the band, band 0 being everything below the first bound. Inclusive upper
+# limits are written as the next float above the limit.
+ScoreBand = Tuple[List[float], Tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class LangProfile:
+    """Language-specific settings read by the shared SEOOptimizer code paths"""
+
+    # Content length unit (words for English, characters for Chinese)
+    measure: Callable[[str], int]
+    sentence_re: re.Pattern
+    # Tokenization for keyword density and LSI extraction
+    tokenize: Callable[[str], Sequence[str]]
+    lowercase_tokens: bool
+    segmented: bool  # keyword density is per segmented word, not per measure
+    stop_words: FrozenSet[str]
+    min_token_length: int
+    # Readability: (avg sentence length upper bound, level, score), in order
+    readability_levels: Tuple[Tuple[float, str, int], ...]
+    readability_fallback: Tuple[str, int]
+    readability_unknown: str
+    # Scoring
+    length_band: ScoreBand
+    density_band: ScoreBand
+    # Meta suggestions
+    title_template: str
+    title_case_keyword: bool
+    title_max_length: int
+    # Over-long titles: truncate the whole title, or fall back to the keyword
+    truncate_full_title: bool
+    description_template: str
+    description_max_length: int
+    # Recommendations
+    min_length: int
+    max_length: int
+    density_range: Tuple[float, float]
+    max_paragraph_length: int
+    max_sentence_length: int
+    messages: Dict[str, str]
+
+
+LANG_PROFILES = {
+    # Google
+    "en": LangProfile(
+        measure=_count_words,
+        sentence_re=_SENT_EN_RE,
+        tokenize=_WORD_EN_RE.findall,
+        lowercase_tokens=True,
+        segmented=False,
+        stop_words=STOP_WORDS_EN,
+        min_token_length=4,
+        readability_levels=(
+            (15, "Easy", 90),
+            (20, "Moderate", 70),
+            (25, "Difficult", 50),
+        ),
+        readability_fallback=("Very Difficult", 30),
+        readability_unknown="Unknown",
+        length_band=([200, 300, 2501], (0, 10, 20, 15)),
+        density_band=([0.005, 0.01, math.nextafter(0.03, math.inf)], (0, 8, 15, 0)),
+        title_template="{keyword} - Complete Guide",
+        title_case_keyword=True,
+        title_max_length=60,
+        truncate_full_title=False,
+        description_template="Learn everything about {keyword}. {first_sentence}",
+        description_max_length=160,
+        min_length=300,
+        max_length=3000,
+        density_range=(0.01, 0.03),
+        max_paragraph_length=150,
+        max_sentence_length=20,
+        messages={
+            "too_short": "Increase content length to at least 300 words (currently {length})",
+            "too_long": "Consider breaking long content into multiple pages or adding a table of contents",
+            "density_low": "Increase keyword density for '{keyword}' (currently {density:.2%})",
+            "density_high": "Reduce keyword density to avoid over-optimization (currently {density:.2%})",
+            "first_paragraph": "Include primary keyword in the first paragraph",
+            "no_headings": "Add headings (H1, H2, H3) to improve content structure",
+            "no_internal_links": "Add internal links to related content",
+            "long_paragraphs": "Break up long paragraphs for better readability",
+            "long_sentences": "Simplify sentences for better readability",
+        },
+    ),
+    # Baidu
+    "zh": LangProfile(
+        measure=_count_cjk,
+        sentence_re=_SENT_ZH_RE,
+        tokenize=segment_chinese,
+        lowercase_tokens=False,
+        segmented=True,
+        stop_words=STOP_WORDS_ZH,
+        min_token_length=2,
+        readability_levels=(
+            (20, "易读", 90),
+            (35, "中等", 70),
+            (50, "较难", 50),
+        ),
+        readability_fallback=("困难", 30),
+        readability_unknown="未知",
+        length_band=([300, 500, 3001], (0, 10, 20, 15)),
+        density_band=([0.01, 0.02, math.nextafter(0.08, math.inf)], (0, 8, 15, 0)),
+        title_template="{keyword} - 完整指南",
+        title_case_keyword=False,
+        title_max_length=30,
+        truncate_full_title=True,
+        description_template="了解关于{keyword}的一切。{first_sentence}",
+        description_max_length=120,
+        min_length=500,
+        max_length=5000,
+        density_range=(0.02, 0.08),
+        max_paragraph_length=300,
+        max_sentence_length=50,
+        messages={
+            "too_short": "建议增加内容长度至少500字（当前{length}字）",
+            "too_long": "内容较长，建议分页或添加目录",
+            "density_low": "建议增加关键词密度（当前{density:.1%}，建议2%-8%）",
+            "density_high": "关键词密度过高（当前{density:.1%}），可能被判定为关键词堆砌",
+            "first_paragraph": "建议在首段包含主要关键词",
+            "no_headings": "建议添加标题（H1、H2、H3）优化内容结构",
+            "no_internal_links": "建议添加内链指向相关内容",
+            "long_paragraphs": "段落过长，建议拆分提升可读性",
+            "long_sentences": "句子较长，建议简化提升可读性",
+        },
+    ),
+}
+
+
+def _band_points(value: float, band: ScoreBand) -> int:
+    """Look up the points awarded for value in a score band"""
+    bounds, points = band
+    return points[bisect.bisect_right(bounds, value)]
 
 
 class SEOOptimizer:
     def __init__(self):
         # English stop words
-        self.stop_words_en = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "as",
-            "is",
-            "was",
-            "are",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "can",
-            "shall",
-        }
+        self.stop_words_en = STOP_WORDS_EN
 
         # Chinese stop words
-        self.stop_words_zh = {
-            "的",
-            "是",
-            "在",
-            "了",
-            "和",
-            "与",
-            "或",
-            "有",
-            "这",
-            "那",
-            "我",
-            "你",
-            "他",
-            "她",
-            "它",
-            "们",
-            "就",
-            "也",
-            "都",
-            "而",
-            "及",
-            "着",
-            "把",
-            "被",
-            "让",
-            "给",
-            "从",
-            "到",
-            "为",
-            "以",
-            "对",
-            "于",
-            "但",
-            "如",
-            "若",
-            "因",
-            "所",
-            "能",
-            "会",
-            "可以",
-            "已经",
-            "可能",
-            "应该",
-            "需要",
-            "这个",
-            "那个",
-            "什么",
-            "怎么",
-            "如何",
-            "为什么",
-            "因为",
-            "所以",
-            "但是",
-            "然而",
-            "不过",
-            "如果",
-            "虽然",
-            "即使",
-            "无论",
-            "一个",
-            "一种",
-            "一些",
-            "这些",
-            "那些",
-            "自己",
-            "我们",
-            "你们",
-            "他们",
-            "它们",
-        }
+        self.stop_words_zh = STOP_WORDS_ZH
 
         # SEO best practices for English (Google)
-        self.best_practices_en = {
-            "title_length": (50, 60),
-            "meta_description_length": (150, 160),
-            "url_length": (50, 60),
-            "paragraph_length": (40, 150),
-            "heading_keyword_placement": True,
-            "keyword_density": (0.01, 0.03),  # 1-3%
-        }
+        self.best_practices_en = BEST_PRACTICES_EN
 
         # SEO best practices for Chinese (Baidu)
-        self.best_practices_zh = {
-            "title_length": (20, 30),  # 20-30 Chinese characters
-            "meta_description_length": (80, 120),  # 80-120 Chinese characters
-            "url_length": (30, 50),
-            "paragraph_length": (100, 300),  # Chinese characters
-            "heading_keyword_placement": True,
-            "keyword_density": (0.02, 0.08),  # 2-8% for Chinese
-        }
+        self.best_practices_zh = BEST_PRACTICES_ZH
 
     def analyze(
         self,
@@ -196,15 +518,14 @@ class SEOOptimizer:
         """Analyze content for SEO optimization"""
 
         language = detect_language(content)
+        scan = self._scan(content, language, tokens=bool(target_keyword))
 
         analysis = {
             "language": language,
-            "content_length": len(content.split())
-            if language == "en"
-            else len(re.findall(r"[\u4e00-\u9fff]", content)),
+            "content_length": scan["content_length"],
             "keyword_analysis": {},
-            "structure_analysis": self._analyze_structure(content, language),
-            "readability": self._analyze_readability(content, language),
+            "structure_analysis": scan["structure"],
+            "readability": self._analyze_readability(scan, language),
             "meta_suggestions": {},
             "optimization_score": 0,
             "recommendations": [],
@@ -213,7 +534,7 @@ class SEOOptimizer:
         # Keyword analysis
         if target_keyword:
             analysis["keyword_analysis"] = self._analyze_keywords(
-                content, target_keyword, secondary_keywords or [], language
+                scan, target_keyword, secondary_keywords or [], language
             )
 
         # Generate meta suggestions
@@ -229,22 +550,55 @@ class SEOOptimizer:
 
         return analysis
 
+    def _scan(self, content: str, language: str, tokens: bool = True) -> Dict:
+        """Compute the text statistics shared by the analysis steps.
+
+        Lowercasing, length and sentence counting, and tokenization each run
+        once here rather than once per step. Tokenization (and the segmented
+        word count) is only needed for keyword analysis; pass tokens=False
+        to skip it.
+        """
+        profile = LANG_PROFILES[language]
+        content_lower = content.lower()
+        content_length = profile.measure(content)
+
+        scan = {
+            "content": content,
+            "content_lower": content_lower,
+            "content_length": content_length,
+            "word_count": content_length,
+            "sentence_count": profile.sentence_re.subn("", content)[1] + 1,
+            "structure": self._analyze_structure(content, language),
+            "token_freq": Counter(),
+        }
+
+        if tokens:
+            words = profile.tokenize(
+                content_lower if profile.lowercase_tokens else content
+            )
+            if profile.segmented:
+                scan["word_count"] = sum(1 for w in words if w.strip())
+            scan["token_freq"] = Counter(
+                w
+                for w in words
+                if w not in profile.stop_words
+                and len(w) >= profile.min_token_length
+            )
+
+        return scan
+
     def _analyze_keywords(
-        self, content: str, primary: str, secondary: List[str], language: str = "en"
+        self, scan: Dict, primary: str, secondary: List[str], language: str = "en"
     ) -> Dict:
         """Analyze keyword usage and density"""
-        content_lower = content.lower()
-
-        if language == "zh":
-            words = segment_chinese(content)
-            word_count = len([w for w in words if w.strip()])
-        else:
-            word_count = len(content.split())
+        content_lower = scan["content_lower"]
+        primary_lower = primary.lower()
+        word_count = scan["word_count"]
 
         results = {
             "primary_keyword": {
                 "keyword": primary,
-                "count": content_lower.count(primary.lower()),
+                "count": content_lower.count(primary_lower),
                 "density": 0,
                 "in_title": False,
                 "in_headings": False,
@@ -260,15 +614,22 @@ class SEOOptimizer:
                 results["primary_keyword"]["count"] / word_count
             )
 
-        # Check keyword placement
-        first_para = content.split("\n\n")[0] if "\n\n" in content else content[:200]
+        # Check keyword placement. The paragraph is cut from the original
+        # content: lower() is not length-preserving ("İ" becomes two code
+        # points), so offsets into content_lower would shift the window
+        content = scan["content"]
+        para_end = content.find("\n\n")
+        first_para = content[:para_end] if para_end >= 0 else content[:200]
         results["primary_keyword"]["in_first_paragraph"] = (
-            primary.lower() in first_para.lower()
+            primary_lower in first_para.lower()
         )
 
         # Analyze secondary keywords
+        secondary_counts = _count_keywords(
+            content_lower, [keyword.lower() for keyword in secondary]
+        )
         for keyword in secondary:
-            count = content_lower.count(keyword.lower())
+            count = secondary_counts[keyword.lower()]
             results["secondary_keywords"].append(
                 {
                     "keyword": keyword,
@@ -278,14 +639,14 @@ class SEOOptimizer:
             )
 
         # Extract potential LSI keywords
-        results["lsi_keywords"] = self._extract_lsi_keywords(content, primary, language)
+        results["lsi_keywords"] = self._extract_lsi_keywords(
+            scan["token_freq"], primary, language
+        )
 
         return results
 
     def _analyze_structure(self, content: str, language: str = "en") -> Dict:
         """Analyze content structure for SEO"""
-        lines = content.split("\n")
-
         structure = {
             "headings": {"h1": 0, "h2": 0, "h3": 0, "total": 0},
             "paragraphs": 0,
@@ -295,114 +656,69 @@ class SEOOptimizer:
             "avg_paragraph_length": 0,
         }
 
-        paragraphs = []
-        current_para = []
-
-        for line in lines:
-            # Count headings
-            if line.startswith("# "):
-                structure["headings"]["h1"] += 1
-                structure["headings"]["total"] += 1
-            elif line.startswith("## "):
-                structure["headings"]["h2"] += 1
-                structure["headings"]["total"] += 1
-            elif line.startswith("### "):
-                structure["headings"]["h3"] += 1
-                structure["headings"]["total"] += 1
+        measure = LANG_PROFILES[language].measure
+        para_count = 0
+        para_length_sum = 0
+        in_para = False
+
+        for line in _iter_lines(content):
+            # Count links (one scan, internal vs external by target prefix)
+            if "[" in line:
+                for match in _LINK_RE.finditer(line):
+                    if match.group(1)[0] == "/":
+                        structure["links"]["internal"] += 1
+                    else:
+                        structure["links"]["external"] += 1
+
+            # Count headings; any "#" line ends the current paragraph
+            if line.startswith("#"):
+                level = 1
+                while level < 4 and line[level : level + 1] == "#":
+                    level += 1
+                if level <= 3 and line[level : level + 1] == " ":
+                    structure["headings"][("h1", "h2", "h3")[level - 1]] += 1
+                    structure["headings"]["total"] += 1
+                in_para = False
+                continue
+
+            stripped = line.strip()
 
             # Count lists
-            if line.strip().startswith(("- ", "* ", "1. ")):
+            if stripped[:2] in ("- ", "* ") or (
+                stripped[:1].isdigit() and stripped[1:3] == ". "
+            ):
                 structure["lists"] += 1
 
-            # Count links
-            internal_links = len(re.findall(r"\[.*?\]\(/.*?\)", line))
-            external_links = len(re.findall(r"\[.*?\]\(https?://.*?\)", line))
-            structure["links"]["internal"] += internal_links
-            structure["links"]["external"] += external_links
-
-            # Track paragraphs
-            if line.strip() and not line.startswith("#"):
-                current_para.append(line)
-            elif current_para:
-                paragraphs.append(" ".join(current_para))
-                current_para = []
-
-        if current_para:
-            paragraphs.append(" ".join(current_para))
-
-        structure["paragraphs"] = len(paragraphs)
-
-        if paragraphs:
-            if language == "zh":
-                avg_length = sum(
-                    len(re.findall(r"[\u4e00-\u9fff]", p)) for p in paragraphs
-                ) / len(paragraphs)
+            # Track paragraphs (lengths are summed line by line as we go)
+            if stripped:
+                if not in_para:
+                    para_count += 1
+                    in_para = True
+                para_length_sum += measure(line)
             else:
-                avg_length = sum(len(p.split()) for p in paragraphs) / len(paragraphs)
-            structure["avg_paragraph_length"] = round(avg_length, 1)
+                in_para = False
+
+        structure["paragraphs"] = para_count
+
+        if para_count:
+            structure["avg_paragraph_length"] = round(para_length_sum / para_count, 1)
 
         return structure
 
-    def _analyze_readability(self, content: str, language: str = "en") -> Dict:
+    def _analyze_readability(self, scan: Dict, language: str = "en") -> Dict:
         """Analyze content readability"""
-        if language == "zh":
-            return self._analyze_readability_zh(content)
-        else:
-            return self._analyze_readability_en(content)
-
-    def _analyze_readability_zh(self, content: str) -> Dict:
-        """Analyze Chinese content readability"""
-        sentences = re.split(r"[。！？；\n]+", content)
-        char_count = len(re.findall(r"[\u4e00-\u9fff]", content))
-
-        if not sentences or char_count == 0:
-            return {"score": 0, "level": "未知"}
-
-        avg_sentence_length = char_count / len(sentences)
-
-        # Chinese readability scoring
-        if avg_sentence_length < 20:
-            level = "易读"
-            score = 90
-        elif avg_sentence_length < 35:
-            level = "中等"
-            score = 70
-        elif avg_sentence_length < 50:
-            level = "较难"
-            score = 50
-        else:
-            level = "困难"
-            score = 30
+        profile = LANG_PROFILES[language]
 
-        return {
-            "score": score,
-            "level": level,
-            "avg_sentence_length": round(avg_sentence_length, 1),
-        }
+        if scan["content_length"] == 0:
+            return {"score": 0, "level": profile.readability_unknown}
+
+        avg_sentence_length = scan["content_length"] / scan["sentence_count"]
 
-    def _analyze_readability_en(self, content: str) -> Dict:
-        """Analyze English content readability"""
-        sentences = re.split(r"[.!?]+", content)
-        words = content.split()
-
-        if not sentences or not words:
-            return {"score": 0, "level": "Unknown"}
-
-        avg_sentence_length = len(words) / len(sentences)
-
-        # Simple readability scoring
-        if avg_sentence_length < 15:
-            level = "Easy"
-            score = 90
-        elif avg_sentence_length < 20:
-            level = "Moderate"
-            score = 70
-        elif avg_sentence_length < 25:
-            level = "Difficult"
-            score = 50
-        else:
-            level = "Very Difficult"
-            score = 30
+        level, score = profile.readability_fallback
+        for upper, band_level, band_score in profile.readability_levels:
+            if avg_sentence_length < upper:
+                level, score = band_level, band_score
+                break
 
         return {
             "score": score,
@@ -411,56 +727,18 @@ class SEOOptimizer:
         }
 
     def _extract_lsi_keywords(
-        self, content: str, primary_keyword: str, language: str = "en"
+        self, token_freq: Counter, primary_keyword: str, language: str = "en"
     ) -> List[str]:
         """Extract potential LSI (semantically related) keywords"""
-        if language == "zh":
-            return self._extract_lsi_keywords_zh(content, primary_keyword)
-        else:
-            return self._extract_lsi_keywords_en(content, primary_keyword)
-
-    def _extract_lsi_keywords_zh(self, content: str, primary_keyword: str) -> List[str]:
-        """Extract LSI keywords for Chinese content"""
-        words = segment_chinese(content)
-        word_freq = {}
-
-        for word in words:
-            if word not in self.stop_words_zh and len(word) > 1:
-                word_freq[word] = word_freq.get(word, 0) + 1
-
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-
-        lsi_keywords = []
-        for word, count in sorted_words:
-            if word != primary_keyword and count > 1:
-                lsi_keywords.append(word)
-            if len(lsi_keywords) >= 10:
-                break
-
-        return lsi_keywords
-
-    def _extract_lsi_keywords_en(self, content: str, primary_keyword: str) -> List[str]:
-        """Extract LSI keywords for English content"""
-        words = re.findall(r"\b[a-z]+\b", content.lower())
-        word_freq = {}
-
-        # Count word frequencies
-        for word in words:
-            if word not in self.stop_words_en and len(word) > 3:
-                word_freq[word] = word_freq.get(word, 0) + 1
+        if LANG_PROFILES[language].lowercase_tokens:
+            primary_keyword = primary_keyword.lower()
 
-        # Sort by frequency and return top related terms
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-
-        # Filter out the primary keyword and return top 10
-        lsi_keywords = []
-        for word, count in sorted_words:
-            if word != primary_keyword.lower() and count > 1:
-                lsi_keywords.append(word)
-            if len(lsi_keywords) >= 10:
-                break
-
-        return lsi_keywords
+        # The primary keyword can take at most one of the top slots
+        return [
+            word
+            for word, count in token_freq.most_common(11)
+            if word != primary_keyword and count > 1
+        ][:10]
 
     def _generate_meta_suggestions(
         self, content: str, keyword: str = None, language: str = "en"
@@ -474,146 +752,60 @@ class SEOOptimizer:
             "og_description": "",
         }
 
-        if language == "zh":
-            return self._generate_meta_suggestions_zh(content, keyword, suggestions)
-        else:
-            return self._generate_meta_suggestions_en(content, keyword, suggestions)
+        if not keyword:
+            return suggestions
 
-    def _generate_meta_suggestions_zh(
-        self, content: str, keyword: str, suggestions: Dict
-    ) -> Dict:
-        """Generate meta suggestions for Chinese content (Baidu SEO)"""
-        # Extract first sentence for description base
-        sentences = re.split(r"[。！？；\n]+", content)
-        first_sentence = sentences[0] if sentences else content[:120]
-
-        if keyword:
-            # Title suggestion (20-30 Chinese characters for Baidu)
-            suggestions["title"] = f"{keyword} - 完整指南"
-            if len(suggestions["title"]) > 30:
-                suggestions["title"] = suggestions["title"][:27] + "..."
-
-            # Meta description (80-120 Chinese characters for Baidu)
-            desc_base = f"了解关于{keyword}的一切。{first_sentence}"
-            if len(desc_base) > 120:
-                desc_base = desc_base[:117] + "..."
-            suggestions["meta_description"] = desc_base
-
-            # URL slug (use pinyin or English equivalent)
-            suggestions["url_slug"] = re.sub(
-                r"[^a-z0-9-]+", "-", keyword.lower()
-            ).strip("-")
-
-            # Open Graph tags
-            suggestions["og_title"] = suggestions["title"]
-            suggestions["og_description"] = suggestions["meta_description"]
+        profile = LANG_PROFILES[language]
 
-        return suggestions
+        # Extract first sentence for description base (anything past the
+        # description length would be truncated anyway)
+        match = profile.sentence_re.search(content)
+        first_sentence = (
+            content[: match.start()]
+            if match
+            else content[: profile.description_max_length]
+        )
 
-    def _generate_meta_suggestions_en(
-        self, content: str, keyword: str, suggestions: Dict
-    ) -> Dict:
-        """Generate meta suggestions for English content (Google SEO)"""
-        # Extract first sentence for description base
-        sentences = re.split(r"[.!?]+", content)
-        first_sentence = sentences[0] if sentences else content[:160]
-
-        if keyword:
-            # Title suggestion
-            suggestions["title"] = f"{keyword.title()} - Complete Guide"
-            if len(suggestions["title"]) > 60:
-                suggestions["title"] = keyword.title()[:57] + "..."
-
-            # Meta description
-            desc_base = f"Learn everything about {keyword}. {first_sentence}"
-            if len(desc_base) > 160:
-                desc_base = desc_base[:157] + "..."
-            suggestions["meta_description"] = desc_base
-
-            # URL slug
-            suggestions["url_slug"] = re.sub(
-                r"[^a-z0-9-]+", "-", keyword.lower()
-            ).strip("-")
-
-            # Open Graph tags
-            suggestions["og_title"] = suggestions["title"]
-            suggestions["og_description"] = suggestions["meta_description"]
+        # Title suggestion
+        title_keyword = keyword.title() if profile.title_case_keyword else keyword
+        title = profile.title_template.format(keyword=title_keyword)
+        if len(title) > profile.title_max_length:
+            base = title if profile.truncate_full_title else title_keyword
+            title = base[: profile.title_max_length - 3] + "..."
+        suggestions["title"] = title
+
+        # Meta description
+        desc_base = profile.description_template.format(
+            keyword=keyword, first_sentence=first_sentence
+        )
+        if len(desc_base) > profile.description_max_length:
+            desc_base = desc_base[: profile.description_max_length - 3] + "..."
+        suggestions["meta_description"] = desc_base
+
+        # URL slug (use pinyin or English equivalent for Chinese keywords)
+        suggestions["url_slug"] = _SLUG_RE.sub("-", keyword.lower()).strip("-")
+
+        # Open Graph tags
+        suggestions["og_title"] = suggestions["title"]
+        suggestions["og_description"] = suggestions["meta_description"]
 
         return suggestions
 
     def _calculate_seo_score(self, analysis: Dict, language: str = "en") -> int:
         """Calculate overall SEO optimization score"""
-        if language == "zh":
-            return self._calculate_seo_score_zh(analysis)
-        else:
-            return self._calculate_seo_score_en(analysis)
-
-    def _calculate_seo_score_zh(self, analysis: Dict) -> int:
-        """Calculate SEO score for Chinese content (Baidu)"""
-        score = 0
-        max_score = 100
-
-        # Content length scoring (20 points) - Chinese characters
-        if 500 <= analysis["content_length"] <= 3000:
-            score += 20
-        elif 300 <= analysis["content_length"] < 500:
-            score += 10
-        elif analysis["content_length"] > 3000:
-            score += 15
-
-        # Keyword optimization (30 points) - 2-8% for Chinese
-        if analysis["keyword_analysis"]:
-            kw_data = analysis["keyword_analysis"]["primary_keyword"]
-
-            # Density scoring
-            if 0.02 <= kw_data["density"] <= 0.08:
-                score += 15
-            elif 0.01 <= kw_data["density"] < 0.02:
-                score += 8
-
-            # Placement scoring
-            if kw_data["in_first_paragraph"]:
-                score += 10
-            if kw_data.get("in_headings"):
-                score += 5
-
-        # Structure scoring (25 points)
-        struct = analysis["structure_analysis"]
-        if struct["headings"]["total"] > 0:
-            score += 10
-        if struct["paragraphs"] >= 3:
-            score += 10
-        if struct["links"]["internal"] > 0 or struct["links"]["external"] > 0:
-            score += 5
-
-        # Readability scoring (25 points)
-        readability_score = analysis["readability"]["score"]
-        score += int(readability_score * 0.25)
-
-        return min(score, max_score)
-
-    def _calculate_seo_score_en(self, analysis: Dict) -> int:
-        """Calculate SEO score for English content (Google)"""
+        profile = LANG_PROFILES[language]
         score = 0
         max_score = 100
 
         # Content length scoring (20 points)
-        if 300 <= analysis["content_length"] <= 2500:
-            score += 20
-        elif 200 <= analysis["content_length"] < 300:
-            score += 10
-        elif analysis["content_length"] > 2500:
-            score += 15
+        score += _band_points(analysis["content_length"], profile.length_band)
 
         # Keyword optimization (30 points)
         if analysis["keyword_analysis"]:
             kw_data = analysis["keyword_analysis"]["primary_keyword"]
 
             # Density scoring
-            if 0.01 <= kw_data["density"] <= 0.03:
-                score += 15
-            elif 0.005 <= kw_data["density"] < 0.01:
-                score += 8
+            score += _band_points(kw_data["density"], profile.density_band)
 
             # Placement scoring
             if kw_data["in_first_paragraph"]:
@@ -640,113 +832,79 @@ class SEOOptimizer:
         self, analysis: Dict, language: str = "en"
     ) -> List[str]:
         """Generate SEO improvement recommendations"""
-        if language == "zh":
-            return self._generate_recommendations_zh(analysis)
-        else:
-            return self._generate_recommendations_en(analysis)
-
-    def _generate_recommendations_zh(self, analysis: Dict) -> List[str]:
-        """Generate recommendations for Chinese content"""
+        profile = LANG_PROFILES[language]
+        messages = profile.messages
         recommendations = []
 
         # Content length recommendations
-        if analysis["content_length"] < 500:
+        if analysis["content_length"] < profile.min_length:
             recommendations.append(
-                f"建议增加内容长度至少500字（当前{analysis['content_length']}字）"
+                messages["too_short"].format(length=analysis["content_length"])
             )
-        elif analysis["content_length"] > 5000:
-            recommendations.append("内容较长，建议分页或添加目录")
+        elif analysis["content_length"] > profile.max_length:
+            recommendations.append(messages["too_long"])
 
         # Keyword recommendations
         if analysis["keyword_analysis"]:
             kw_data = analysis["keyword_analysis"]["primary_keyword"]
+            min_density, max_density = profile.density_range
 
-            if kw_data["density"] < 0.02:
-                recommendations.append(
-                    f"建议增加关键词密度（当前{kw_data['density']:.1%}，建议2%-8%）"
-                )
-            elif kw_data["density"] > 0.08:
-                recommendations.append(
-                    f"关键词密度过高（当前{kw_data['density']:.1%}），可能被判定为关键词堆砌"
-                )
+            if kw_data["density"] < min_density:
+                recommendations.append(messages["density_low"].format(**kw_data))
+            elif kw_data["density"] > max_density:
+                recommendations.append(messages["density_high"].format(**kw_data))
 
             if not kw_data["in_first_paragraph"]:
-                recommendations.append("建议在首段包含主要关键词")
+                recommendations.append(messages["first_paragraph"])
 
         # Structure recommendations
         struct = analysis["structure_analysis"]
         if struct["headings"]["total"] == 0:
-            recommendations.append("建议添加标题（H1、H2、H3）优化内容结构")
+            recommendations.append(messages["no_headings"])
         if struct["links"]["internal"] == 0:
-            recommendations.append("建议添加内链指向相关内容")
-        if struct["avg_paragraph_length"] > 300:
-            recommendations.append("段落过长，建议拆分提升可读性")
+            recommendations.append(messages["no_internal_links"])
+        if struct["avg_paragraph_length"] > profile.max_paragraph_length:
+            recommendations.append(messages["long_paragraphs"])
 
         # Readability recommendations
-        if analysis["readability"]["avg_sentence_length"] > 50:
-            recommendations.append("句子较长，建议简化提升可读性")
+        if analysis["readability"]["avg_sentence_length"] > profile.max_sentence_length:
+            recommendations.append(messages["long_sentences"])
 
         return recommendations
 
-    def _generate_recommendations_en(self, analysis: Dict) -> List[str]:
-        """Generate recommendations for English content"""
-        recommendations = []
 
-        # Content length recommendations
-        if analysis["content_length"] < 300:
-            recommendations.append(
-                f"Increase content length to at least 300 words (currently {analysis['content_length']})"
-            )
-        elif analysis["content_length"] > 3000:
-            recommendations.append(
-                "Consider breaking long content into multiple pages or adding a table of contents"
-            )
+_OPTIMIZER = None
 
-        # Keyword recommendations
-        if analysis["keyword_analysis"]:
-            kw_data = analysis["keyword_analysis"]["primary_keyword"]
 
-            if kw_data["density"] < 0.01:
-                recommendations.append(
-                    f"Increase keyword density for '{kw_data['keyword']}' (currently {kw_data['density']:.2%})"
-                )
-            elif kw_data["density"] > 0.03:
-                recommendations.append(
-                    f"Reduce keyword density to avoid over-optimization (currently {kw_data['density']:.2%})"
-                )
+def _get_optimizer() -> SEOOptimizer:
+    """Return the shared SEOOptimizer, creating it on first use"""
+    global _OPTIMIZER
+    if _OPTIMIZER is None:
+        _OPTIMIZER = SEOOptimizer()
+    return _OPTIMIZER
 
-            if not kw_data["in_first_paragraph"]:
-                recommendations.append("Include primary keyword in the first paragraph")
 
-        # Structure recommendations
-        struct = analysis["structure_analysis"]
-        if struct["headings"]["total"] == 0:
-            recommendations.append(
-                "Add headings (H1, H2, H3) to improve content structure"
-            )
-        if struct["links"]["internal"] == 0:
-            recommendations.append("Add internal links to related content")
-        if struct["avg_paragraph_length"] > 150:
-            recommendations.append("Break up long paragraphs for better readability")
-
-        # Readability recommendations
-        if analysis["readability"]["avg_sentence_length"] > 20:
-            recommendations.append("Simplify sentences for better readability")
-
-        return recommendations
+def _secondary_key(secondary_keywords) -> Tuple[str, ...]:
+    """Normalize secondary keywords to a hashable tuple for the caches"""
+    # Parse secondary keywords from comma-separated string if provided
+    if secondary_keywords and isinstance(secondary_keywords, str):
+        secondary_keywords = [kw.strip() for kw in secondary_keywords.split(",")]
+    return tuple(secondary_keywords or ())
 
 
 def optimize_content(
     content: str, keyword: str = None, secondary_keywords: List[str] = None
 ) -> str:
     """Main function to optimize content"""
-    optimizer = SEOOptimizer()
+    return _cached_optimize(content, keyword, _secondary_key(secondary_keywords))
 
-    # Parse secondary keywords from comma-separated string if provided
-    if secondary_keywords and isinstance(secondary_keywords, str):
-        secondary_keywords = [kw.strip() for kw in secondary_keywords.split(",")]
 
-    results = optimizer.analyze(content, keyword, secondary_keywords)
+@functools.lru_cache(maxsize=128)
+def _cached_optimize(
+    content: str, keyword: Optional[str], secondary_keywords: Tuple[str, ...]
+) -> str:
+    """Analyze and format content, memoized on the exact inputs"""
+    results = _get_optimizer().analyze(content, keyword, list(secondary_keywords))
     language = results.get("language", "en")
 
     if language == "zh":
@@ -755,114 +913,120 @@ def optimize_content(
         return _format_output_en(results)
 
 
+def analyze_json(
+    content: str, keyword: str = None, secondary_keywords: List[str] = None
+) -> str:
+    """Return the raw analysis as a JSON string, memoized on the exact inputs.
+
+    The cached value is an immutable string; call json.loads() to get a dict.
+    """
+    return _cached_analyze_json(content, keyword, _secondary_key(secondary_keywords))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_analyze_json(
+    content: str, keyword: Optional[str], secondary_keywords: Tuple[str, ...]
+) -> str:
+    results = _get_optimizer().analyze(content, keyword, list(secondary_keywords))
+    return _dumps(results)
+
+
 def _format_output_zh(results: Dict) -> str:
     """Format output for Chinese content"""
-    output = [
-        "=== SEO 内容分析 ===",
-        f"SEO 总分: {results['optimization_score']}/100",
-        f"内容长度: {results['content_length']} 字",
-        "",
-        "内容结构:",
-        f"  标题数: {results['structure_analysis']['headings']['total']}",
-        f"  段落数: {results['structure_analysis']['paragraphs']}",
-        f"  平均段落长度: {results['structure_analysis']['avg_paragraph_length']} 字",
-        f"  内链数: {results['structure_analysis']['links']['internal']}",
-        f"  外链数: {results['structure_analysis']['links']['external']}",
-        "",
-        f"可读性: {results['readability']['level']} (评分: {results['readability']['score']})",
-        "",
-    ]
+    return "\n".join(_iter_output_zh(results))
+
+
+def _iter_output_zh(results: Dict) -> Iterator[str]:
+    """Yield the lines of the Chinese report"""
+    structure = results["structure_analysis"]
+    yield "=== SEO 内容分析 ==="
+    yield f"SEO 总分: {results['optimization_score']}/100"
+    yield f"内容长度: {results['content_length']} 字"
+    yield ""
+    yield "内容结构:"
+    yield f"  标题数: {structure['headings']['total']}"
+    yield f"  段落数: {structure['paragraphs']}"
+    yield f"  平均段落长度: {structure['avg_paragraph_length']} 字"
+    yield f"  内链数: {structure['links']['internal']}"
+    yield f"  外链数: {structure['links']['external']}"
+    yield ""
+    yield f"可读性: {results['readability']['level']} (评分: {results['readability']['score']})"
+    yield ""
 
     if results["keyword_analysis"]:
         kw = results["keyword_analysis"]["primary_keyword"]
-        output.extend(
-            [
-                "关键词分析:",
-                f"  主关键词: {kw['keyword']}",
-                f"  出现次数: {kw['count']}",
-                f"  关键词密度: {kw['density']:.1%}",
-                f"  首段包含: {'是' if kw['in_first_paragraph'] else '否'}",
-                "",
-            ]
-        )
+        yield "关键词分析:"
+        yield f"  主关键词: {kw['keyword']}"
+        yield f"  出现次数: {kw['count']}"
+        yield f"  关键词密度: {kw['density']:.1%}"
+        yield f"  首段包含: {'是' if kw['in_first_paragraph'] else '否'}"
+        yield ""
 
         if results["keyword_analysis"]["lsi_keywords"]:
-            output.append("  相关关键词:")
+            yield "  相关关键词:"
             for lsi in results["keyword_analysis"]["lsi_keywords"][:5]:
-                output.append(f"    • {lsi}")
-            output.append("")
+                yield f"    • {lsi}"
+            yield ""
 
     if results["meta_suggestions"]:
-        output.extend(
-            [
-                "Meta 标签建议:",
-                f"  标题: {results['meta_suggestions']['title']}",
-                f"  描述: {results['meta_suggestions']['meta_description']}",
-                f"  URL: {results['meta_suggestions']['url_slug']}",
-                "",
-            ]
-        )
+        yield "Meta 标签建议:"
+        yield f"  标题: {results['meta_suggestions']['title']}"
+        yield f"  描述: {results['meta_suggestions']['meta_description']}"
+        yield f"  URL: {results['meta_suggestions']['url_slug']}"
+        yield ""
 
-    output.append("优化建议:")
+    yield "优化建议:"
     for rec in results["recommendations"]:
-        output.append(f"  • {rec}")
-
-    return "\n".join(output)
+        yield f"  • {rec}"
 
 
 def _format_output_en(results: Dict) -> str:
     """Format output for English content"""
-    output = [
-        "=== SEO Content Analysis ===",
-        f"Overall SEO Score: {results['optimization_score']}/100",
-        f"Content Length: {results['content_length']} words",
-        "",
-        "Content Structure:",
-        f"  Headings: {results['structure_analysis']['headings']['total']}",
-        f"  Paragraphs: {results['structure_analysis']['paragraphs']}",
-        f"  Avg Paragraph Length: {results['structure_analysis']['avg_paragraph_length']} words",
-        f"  Internal Links: {results['structure_analysis']['links']['internal']}",
-        f"  External Links: {results['structure_analysis']['links']['external']}",
-        "",
-        f"Readability: {results['readability']['level']} (Score: {results['readability']['score']})",
-        "",
-    ]
+    return "\n".join(_iter_output_en(results))
+
+
+def _iter_output_en(results: Dict) -> Iterator[str]:
+    """Yield the lines of the English report"""
+    structure = results["structure_analysis"]
+    yield "=== SEO Content Analysis ==="
+    yield f"Overall SEO Score: {results['optimization_score']}/100"
+    yield f"Content Length: {results['content_length']} words"
+    yield ""
+    yield "Content Structure:"
+    yield f"  Headings: {structure['headings']['total']}"
+    yield f"  Paragraphs: {structure['paragraphs']}"
+    yield f"  Avg Paragraph Length: {structure['avg_paragraph_length']} words"
+    yield f"  Internal Links: {structure['links']['internal']}"
+    yield f"  External Links: {structure['links']['external']}"
+    yield ""
+    yield f"Readability: {results['readability']['level']} (Score: {results['readability']['score']})"
+    yield ""
 
     if results["keyword_analysis"]:
         kw = results["keyword_analysis"]["primary_keyword"]
-        output.extend(
-            [
-                "Keyword Analysis:",
-                f"  Primary Keyword: {kw['keyword']}",
-                f"  Count: {kw['count']}",
-                f"  Density: {kw['density']:.2%}",
-                f"  In First Paragraph: {'Yes' if kw['in_first_paragraph'] else 'No'}",
-                "",
-            ]
-        )
+        yield "Keyword Analysis:"
+        yield f"  Primary Keyword: {kw['keyword']}"
+        yield f"  Count: {kw['count']}"
+        yield f"  Density: {kw['density']:.2%}"
+        yield f"  In First Paragraph: {'Yes' if kw['in_first_paragraph'] else 'No'}"
+        yield ""
 
         if results["keyword_analysis"]["lsi_keywords"]:
-            output.append("  Related Keywords Found:")
+            yield "  Related Keywords Found:"
             for lsi in results["keyword_analysis"]["lsi_keywords"][:5]:
-                output.append(f"    • {lsi}")
-            output.append("")
+                yield f"    • {lsi}"
+            yield ""
 
     if results["meta_suggestions"]:
-        output.extend(
-            [
-                "Meta Tag Suggestions:",
-                f"  Title: {results['meta_suggestions']['title']}",
-                f"  Description: {results['meta_suggestions']['meta_description']}",
-                f"  URL Slug: {results['meta_suggestions']['url_slug']}",
-                "",
-            ]
-        )
+        yield "Meta Tag Suggestions:"
+        yield f"  Title: {results['meta_suggestions']['title']}"
+        yield f"  Description: {results['meta_suggestions']['meta_description']}"
+        yield f"  URL Slug: {results['meta_suggestions']['url_slug']}"
+        yield ""
 
-    output.append("Recommendations:")
+    yield "Recommendations:"
     for rec in results["recommendations"]:
-        output.append(f"  • {rec}")
-
-    return "\n".join(output)
+        yield f"  • {rec}"
 
 
 if __name__ == "__main__":
@@ -5,6 +5,33 @@ import json
 import re
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj, indent: bool = False) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+    _loads = json.loads
+
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+_ZH_SENT_RE = re.compile(r'[。！？]')
+_EN_SENT_RE = re.compile(r'[.!?]')
+_ZH_NUMBERING_RE = re.compile(r'[一二三四五六七八九十]+、')
 
 # AI-sounding filler phrases (Chinese)
 AI_FILLERS_ZH = [
@@ -30,37 +57,103 @@ BUZZWORDS = {
 }
 
 
+def _build_automaton(phrases):
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_pattern(phrases, whole_words=False):
+    # Longest first, so a phrase is never shadowed by one of its prefixes
+    ordered = sorted(phrases, key=len, reverse=True)
+    alternation = "|".join(re.escape(phrase) for phrase in ordered)
+    if whole_words:
+        alternation = rf'\b(?:{alternation})\b'
+    return re.compile(alternation)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+# All phrases of a language are matched in one pass: by an Aho-Corasick
+# automaton when pyahocorasick is installed, otherwise by one regex
+# alternation. English phrases are matched against lowercased text and
+# only as whole words, so "to sum up" does not match inside "to sum upward".
+ZH_PHRASES = AI_FILLERS_ZH + list(BUZZWORDS)
+EN_PHRASES = [filler.lower() for filler in AI_FILLERS_EN]
+_ZH_AUTOMATON = _build_automaton(ZH_PHRASES)
+_EN_AUTOMATON = _build_automaton(EN_PHRASES)
+_ZH_PATTERN = _build_pattern(ZH_PHRASES)
+_EN_PATTERN = _build_pattern(EN_PHRASES, whole_words=True)
+
+
+def count_phrases(text: str, phrases: list, automaton, pattern,
+                  whole_words: bool = False) -> dict:
+    """Count non-overlapping occurrences of each phrase in a single pass."""
+    if automaton is None:
+        found = Counter(pattern.findall(text))
+        return {phrase: found[phrase] for phrase in phrases}
+
+    counts = dict.fromkeys(phrases, 0)
+    next_start = dict.fromkeys(phrases, 0)
+    last = len(text) - 1
+    for end, phrase in automaton.iter(text):
+        start = end - len(phrase) + 1
+        if whole_words and ((start > 0 and _is_word_char(text[start - 1]))
+                            or (end < last and _is_word_char(text[end + 1]))):
+            continue
+        if start >= next_start[phrase]:
+            counts[phrase] += 1
+            next_start[phrase] = end + 1
+    return counts
+
+
+def sentences_too_uniform(text: str, split_re) -> bool:
+    """Whether most sentences are within 20% of the average length.
+
+    Sentences are split with split_re; each is stripped and measured once,
+    and those of 5 characters or fewer are ignored. Needs more than five
+    sentences to judge.
+    """
+    lengths = [n for n in (len(s.strip()) for s in split_re.split(text)) if n > 5]
+    if len(lengths) <= 5:
+        return False
+    avg = sum(lengths) / len(lengths)
+    uniform = sum(1 for l in lengths if abs(l - avg) < avg * 0.2)
+    return uniform / len(lengths) > 0.8
+
+
 def analyze_zh(text: str) -> dict:
     issues = []
     score = 100
+    counts = count_phrases(text, ZH_PHRASES, _ZH_AUTOMATON, _ZH_PATTERN)
 
     # Check filler phrases
     for filler in AI_FILLERS_ZH:
-        count = text.count(filler)
+        count = counts[filler]
         if count > 0:
             issues.append(f"发现 AI 味填充词「{filler}」×{count}")
             score -= count * 3
 
     # Check buzzwords
     for bad, good in BUZZWORDS.items():
-        count = text.count(bad)
+        count = counts[bad]
         if count > 0:
             issues.append(f"发现 AI 高频词「{bad}」×{count}，建议改为「{good}」")
             score -= count * 2
 
     # Check sentence length uniformity
-    sentences = re.split(r'[。！？]', text)
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 5]
-    if len(sentences) > 5:
-        lengths = [len(s) for s in sentences]
-        avg = sum(lengths) / len(lengths)
-        uniform = sum(1 for l in lengths if abs(l - avg) < avg * 0.2)
-        if uniform / len(lengths) > 0.8:
-            issues.append("句子长度过于统一，缺乏节奏变化")
-            score -= 10
+    if sentences_too_uniform(text, _ZH_SENT_RE):
+        issues.append("句子长度过于统一，缺乏节奏变化")
+        score -= 10
 
     # Check for "一、二、三" style numbering
-    numbering_pattern = re.findall(r'[一二三四五六七八九十]+、', text)
+    numbering_pattern = _ZH_NUMBERING_RE.findall(text)
     if numbering_pattern:
         issues.append(f"发现中文序号标记（{'、'.join(numbering_pattern[:3])}），请改用 Markdown 标题或 1. 2. 3.")
         score -= len(numbering_pattern) * 5
@@ -78,36 +171,83 @@ def analyze_zh(text: str) -> dict:
 def analyze_en(text: str) -> dict:
     issues = []
     score = 100
+    counts = count_phrases(text.lower(), EN_PHRASES, _EN_AUTOMATON, _EN_PATTERN,
+                           whole_words=True)
 
     for filler in AI_FILLERS_EN:
-        count = text.lower().count(filler.lower())
+        count = counts[filler.lower()]
         if count > 0:
             issues.append(f"Found AI filler phrase: '{filler}' ×{count}")
             score -= count * 3
 
     # Check sentence variety
-    sentences = re.split(r'[.!?]', text)
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 5]
-    if len(sentences) > 5:
-        lengths = [len(s) for s in sentences]
-        avg = sum(lengths) / len(lengths)
-        uniform = sum(1 for l in lengths if abs(l - avg) < avg * 0.2)
-        if uniform / len(lengths) > 0.8:
-            issues.append("Sentence lengths too uniform — vary rhythm")
-            score -= 10
+    if sentences_too_uniform(text, _EN_SENT_RE):
+        issues.append("Sentence lengths too uniform — vary rhythm")
+        score -= 10
 
     score = max(0, min(100, score))
     return {"score": score, "issues": issues, "language": "en"}
 
 
 def detect_language(text: str) -> str:
-    zh_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
+    if text.isascii():
+        return "en"
+    # subn counts the matches in C without building a list of them
+    zh_chars = _CJK_RE.subn('', text)[1]
     return "zh" if zh_chars > len(text) * 0.1 else "en"
 
 
+@lru_cache(maxsize=512)
+def _analyze_cached(text: str) -> str:
+    lang = detect_language(text)
+    result = analyze_zh(text) if lang == "zh" else analyze_en(text)
+    return _dumps(result)
+
+
+def analyze_text(text: str) -> dict:
+    """Run the checks for the text's language, memoized by text.
+
+    The cache holds JSON, so every call returns a fresh dict that callers
+    are free to modify.
+    """
+    return _loads(_analyze_cached(text))
+
+
+def _analyze_path(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        result = analyze_text(f.read())
+    result["file"] = path
+    return result
+
+
+def analyze_corpus(paths: list, workers: int = None) -> list:
+    """Analyze many files, in parallel worker processes when there are several.
+
+    Documents are independent, so they are spread over a process pool; the
+    phrase matchers are built at import, once per worker. Results come back
+    in the order of ``paths``.
+    """
+    if len(paths) < 2 or workers == 1:
+        return [_analyze_path(path) for path in paths]
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    # About four chunks per worker: batches IPC without idling workers
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_path, paths, chunksize=chunksize))
+
+
+def _markdown_files(directory: str) -> list:
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        paths.extend(os.path.join(root, name) for name in sorted(files)
+                     if name.endswith(".md"))
+    return paths
+
+
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python brand_voice_analyzer.py <file-path> [domain]")
+        print("Usage: python brand_voice_analyzer.py <file-or-directory> [domain]")
         sys.exit(1)
 
     file_path = sys.argv[1]
@@ -117,20 +257,19 @@ def main():
         print(f"ERROR: File not found: {file_path}")
         sys.exit(1)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        text = f.read()
-
-    lang = detect_language(text)
-    if lang == "zh":
-        result = analyze_zh(text)
-    else:
-        result = analyze_en(text)
+    # A directory is analyzed as a corpus of its Markdown files
+    if os.path.isdir(file_path):
+        results = analyze_corpus(_markdown_files(file_path))
+        for result in results:
+            result["domain"] = domain
+        print(_dumps(results, indent=True))
+        sys.exit(0 if all(r["score"] >= 70 for r in results) else 1)
 
-    result["file"] = file_path
+    result = _analyze_path(file_path)
     result["domain"] = domain
 
     # Output as JSON
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(_dumps(result, indent=True))
 
     # Exit code based on score
     if result["score"] >= 85: